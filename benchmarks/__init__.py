@@ -0,0 +1,4 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark harness and local Open Food Facts stand-in server."""
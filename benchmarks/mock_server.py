@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Local stand-in for the Open Food Facts API.
+
+Serves /api/v2/search and /api/v2/product/<code> from recorded fixtures, with
+configurable latency, error rate, 429 responses and page sizes, so the scraper
+can be benchmarked without touching the live service.
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SEARCH_FIXTURE = os.path.join(FIXTURES_DIR, "search.json")
+
+
+def load_fixture_products(path=SEARCH_FIXTURE):
+    """Load the recorded search response and return its products"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("products", [])
+
+
+def expand_products(fixture_products, total_products):
+    """Cycle the fixture products up to total_products, giving each copy a unique code"""
+    products = []
+    for i in range(total_products):
+        product = dict(fixture_products[i % len(fixture_products)])
+        if i >= len(fixture_products):
+            product["code"] = product["_id"] = f"{2000000000000 + i}"
+        products.append(product)
+    return products
+
+
+class MockOpenFoodFactsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0.0, jitter_ms=0.0,
+                 error_rate=0.0, rate_limit_rate=0.0, max_page_size=100,
+                 total_products=2000, seed=42, fixture_path=SEARCH_FIXTURE):
+        super().__init__((host, port), MockRequestHandler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.max_page_size = max_page_size
+        self.products = expand_products(load_fixture_products(fixture_path), total_products)
+        self.products_by_code = {p["code"]: p for p in self.products if p.get("code")}
+        self.status_counts = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_outcome(self):
+        """Pick the simulated delay and status code for the next request"""
+        with self._lock:
+            delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+            roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            return delay / 1000, 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return delay / 1000, 500
+        return delay / 1000, 200
+
+    def record_status(self, status):
+        with self._lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        """Keep the benchmark output clean"""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        delay, status = self.server.next_outcome()
+        if delay:
+            time.sleep(delay)
+
+        if status == 429:
+            self._send_json(429, {"status": 429, "status_verbose": "Too Many Requests"},
+                            {"Retry-After": "1"})
+        elif status == 500:
+            self._send_json(500, {"status": 500, "status_verbose": "Internal Server Error"})
+        elif parsed.path.rstrip("/") == "/api/v2/search":
+            self._send_search(query)
+        elif parsed.path.startswith("/api/v2/product/"):
+            self._send_product(parsed.path[len("/api/v2/product/"):].strip("/"), query)
+        else:
+            self._send_json(404, {"status": 0, "status_verbose": "not found"})
+
+    def _send_search(self, query):
+        page = max(_int_param(query, "page", 1), 1)
+        page_size = min(max(_int_param(query, "page_size", 24), 1), self.server.max_page_size)
+        fields = _fields_param(query)
+        start = (page - 1) * page_size
+        products = self.server.products[start:start + page_size]
+        total = len(self.server.products)
+        self._send_json(200, {
+            "count": total,
+            "page": page,
+            "page_count": len(products),
+            "page_size": page_size,
+            "products": [_select_fields(p, fields) for p in products],
+        })
+
+    def _send_product(self, code, query):
+        product = self.server.products_by_code.get(code)
+        if product is None:
+            self._send_json(404, {"code": code, "status": 0, "status_verbose": "product not found"})
+            return
+        self._send_json(200, {
+            "code": code,
+            "product": _select_fields(product, _fields_param(query)),
+            "status": 1,
+            "status_verbose": "product found",
+        })
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.record_status(status)
+
+
+def _int_param(query, name, default):
+    try:
+        return int(query.get(name, [default])[0])
+    except ValueError:
+        return default
+
+
+def _fields_param(query):
+    fields = query.get("fields", [""])[0]
+    return [f for f in fields.split(",") if f]
+
+
+def _select_fields(product, fields):
+    if not fields:
+        return product
+    return {f: product[f] for f in fields if f in product}
+
+
+def start_server(**config):
+    """Start the mock server on a background thread and return it"""
+    server = MockOpenFoodFactsServer(**config)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def record_fixtures(page_size=50, path=SEARCH_FIXTURE):
+    """Refresh the search fixture from the live Open Food Facts API"""
+    import requests
+    from main import FoodScraper, SEARCH_FIELDS
+
+    scraper = FoodScraper()
+    params = {"page": 1, "page_size": page_size, "sort_by": "popularity_key", "fields": SEARCH_FIELDS}
+    response = requests.get(scraper.search_url, headers=scraper.headers, params=params, timeout=30)
+    response.raise_for_status()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(response.json(), f, ensure_ascii=False, indent=2)
+    print(f"Recorded {len(response.json().get('products', []))} products to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Open Food Facts stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Base delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra delay, uniform in [0, jitter]")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--max-page-size", type=int, default=100, help="Upper bound on the page_size honoured")
+    parser.add_argument("--total-products", type=int, default=2000, help="Products available across all pages")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--record", action="store_true", help="Re-record the fixtures from the live API and exit")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures()
+        return
+
+    server = MockOpenFoodFactsServer(
+        host=args.host, port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+        max_page_size=args.max_page_size, total_products=args.total_products, seed=args.seed
+    )
+    print(f"Mock Open Food Facts API listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
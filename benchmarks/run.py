@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Reproducible performance benchmarks for main.py and quick_generator.py.
+
+Every scenario runs in a fresh worker process so its peak RSS is its own.
+Scrape scenarios talk to the local mock server instead of the live API.
+
+Run from the repository root:
+    python -m benchmarks.run                  # run everything, compare to baseline
+    python -m benchmarks.run scrape csv-write # run selected scenarios
+    python -m benchmarks.run --save-baseline  # store the results as the new baseline
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.mock_server import expand_products, load_fixture_products, start_server
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+SEED = 42
+
+# Mock server settings for each scrape scenario
+MOCK_PROFILES = {
+    "scrape": {"latency_ms": 20, "jitter_ms": 10, "max_page_size": 50, "total_products": 1000},
+    "scrape-degraded": {"latency_ms": 50, "jitter_ms": 50, "error_rate": 0.1, "rate_limit_rate": 0.1,
+                        "max_page_size": 25, "total_products": 1000},
+}
+
+# Metrics compared against the baseline, and whether higher is better
+COMPARED_METRICS = {
+    "throughput": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "peak_rss_kb": False,
+}
+
+# Scenarios that time a few dozen whole calls are gated on the median call: their
+# throughput is a mean, their p95/p99 are the slowest call or two, and their min is noisy
+REPEATED_METRICS = {
+    "p50_ms": False,
+    "peak_rss_kb": False,
+}
+
+# Latency changes smaller than these are ignored, however large they are in relative terms:
+# one for scenarios timing requests or whole calls, one for those timing single products
+MIN_LATENCY_DELTA_MS = 5.0
+MIN_ITEM_LATENCY_DELTA_MS = 0.05
+
+
+def _timed(func, repeats):
+    """Call func once to warm up, then repeats times, and return the duration of each timed call"""
+    func()
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def bench_scrape(api_root, total_products, target_count=1000):
+    """Full scrape against the mock API, including the final CSV write"""
+    from main import FoodScraper
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = FoodScraper(target_count=target_count, output_file=os.path.join(tmp, "food_data.csv"),
+                              api_root=api_root, request_delay=0, retry_delay=0.05)
+        start = time.perf_counter()
+        scraper.run()
+        elapsed = time.perf_counter() - start
+
+    # run() quietly pads with synthetic rows when the API fails, which would no longer measure a scrape
+    served_codes = {p["code"] for p in expand_products(load_fixture_products(), total_products)}
+    synthetic = sum(1 for row in scraper.products if row["code_barres"] not in served_codes)
+    if synthetic:
+        raise RuntimeError(f"{synthetic} of {len(scraper.products)} rows did not come from the mock API")
+    return {"items": len(scraper.products), "seconds": elapsed, "latencies": scraper.request_latencies}
+
+
+def bench_transform(count=5000):
+    """Turn raw API products into CSV rows with FoodScraper.process_product"""
+    from main import FoodScraper
+
+    fixture_products = load_fixture_products()
+    products = [fixture_products[i % len(fixture_products)] for i in range(count)]
+    scraper = FoodScraper()
+    latencies = []
+    start = time.perf_counter()
+    for product in products:
+        t0 = time.perf_counter()
+        scraper.process_product(product)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return {"items": count, "seconds": elapsed, "latencies": latencies}
+
+
+def bench_quick_generator(count, repeats=10):
+    """quick_generator.generate_food_data, which also writes its CSV"""
+    from quick_generator import generate_food_data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "food_data.csv")
+        durations = _timed(lambda: generate_food_data(count, output_file), repeats)
+    return {"items": count * repeats, "seconds": sum(durations), "latencies": durations}
+
+
+def bench_fallback(count, repeats=20):
+    """FoodScraper.generate_synthetic_data, the scraper's offline fallback"""
+    from main import FoodScraper
+
+    scraper = FoodScraper(target_count=count)
+    durations = _timed(scraper.generate_synthetic_data, repeats)
+    return {"items": count * repeats, "seconds": sum(durations), "latencies": durations}
+
+
+def bench_csv_write(count=10000, repeats=10):
+    """FoodScraper.save_to_csv on a fixed set of synthetic rows"""
+    from main import FoodScraper
+
+    with tempfile.TemporaryDirectory() as tmp:
+        scraper = FoodScraper(target_count=count, output_file=os.path.join(tmp, "food_data.csv"))
+        scraper.products = scraper.generate_synthetic_data()
+        durations = _timed(scraper.save_to_csv, repeats)
+    return {"items": len(scraper.products) * repeats, "seconds": sum(durations), "latencies": durations}
+
+
+# Scenario name -> (benchmark, metrics compared against the baseline, latency floor in ms)
+SCENARIOS = {
+    "scrape": (lambda api_root: bench_scrape(api_root, MOCK_PROFILES["scrape"]["total_products"]),
+               COMPARED_METRICS, MIN_LATENCY_DELTA_MS),
+    "scrape-degraded": (lambda api_root: bench_scrape(api_root, MOCK_PROFILES["scrape-degraded"]["total_products"]),
+                        COMPARED_METRICS, MIN_LATENCY_DELTA_MS),
+    "transform": (lambda api_root: bench_transform(), COMPARED_METRICS, MIN_ITEM_LATENCY_DELTA_MS),
+    "synthetic-500": (lambda api_root: bench_quick_generator(500, repeats=20), REPEATED_METRICS, MIN_LATENCY_DELTA_MS),
+    "synthetic-2000": (lambda api_root: bench_quick_generator(2000), REPEATED_METRICS, MIN_LATENCY_DELTA_MS),
+    "synthetic-10000": (lambda api_root: bench_quick_generator(10000), REPEATED_METRICS, MIN_LATENCY_DELTA_MS),
+    "fallback-2000": (lambda api_root: bench_fallback(2000), REPEATED_METRICS, MIN_LATENCY_DELTA_MS),
+    "csv-write": (lambda api_root: bench_csv_write(), REPEATED_METRICS, MIN_LATENCY_DELTA_MS),
+}
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KiB, or None where unsupported"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def run_worker(name, api_root):
+    """Run one scenario in this process and print its metrics as JSON"""
+    random.seed(SEED)
+    with contextlib.redirect_stdout(io.StringIO()):
+        raw = SCENARIOS[name][0](api_root)
+    latencies_ms = [s * 1000 for s in raw["latencies"]]
+    result = {
+        "items": raw["items"],
+        "seconds": round(raw["seconds"], 4),
+        "throughput": round(raw["items"] / raw["seconds"], 2) if raw["seconds"] else 0.0,
+        "min_ms": round(min(latencies_ms, default=0.0), 4),
+        "p50_ms": round(percentile(latencies_ms, 50), 4),
+        "p95_ms": round(percentile(latencies_ms, 95), 4),
+        "p99_ms": round(percentile(latencies_ms, 99), 4),
+        "peak_rss_kb": peak_rss_kb(),
+    }
+    print(json.dumps(result))
+
+
+def run_scenario(name):
+    """Run a scenario in a fresh worker process, with a mock server if it needs one"""
+    server = start_server(seed=SEED, **MOCK_PROFILES[name]) if name in MOCK_PROFILES else None
+    # A fixed hash seed keeps dict and set layouts, and with them timings, the same from run to run
+    env = dict(os.environ, TQDM_DISABLE="1", PYTHONHASHSEED=str(SEED))
+    command = [sys.executable, "-m", "benchmarks.run", "--worker", name]
+    if server:
+        command += ["--api-root", server.url]
+    try:
+        completed = subprocess.run(command, cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+    if completed.returncode != 0:
+        print(completed.stderr, file=sys.stderr)
+        raise RuntimeError(f"Scenario {name} failed with exit code {completed.returncode}")
+    if server and not server.status_counts.get(200):
+        raise RuntimeError(f"Scenario {name} got no successful responses from the mock API")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    if server:
+        result["responses"] = {str(k): v for k, v in sorted(server.status_counts.items())}
+    return result
+
+
+def compare(results, baseline, threshold):
+    """Print the change against the baseline and return the regressed metrics"""
+    regressions = []
+    print(f"\nComparison with baseline (threshold {threshold:.0%}):")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            print(f"  {name:<16} no baseline entry")
+            continue
+        changes = []
+        _, metrics, latency_floor_ms = SCENARIOS[name]
+        for metric, higher_is_better in metrics.items():
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            regressed = -change > threshold if higher_is_better else change > threshold
+            if metric.endswith("_ms") and abs(new - old) < latency_floor_ms:
+                regressed = False
+            if regressed:
+                regressions.append(f"{name}.{metric}")
+            changes.append(f"{metric} {change:+.1%}{' REGRESSION' if regressed else ''}")
+        print(f"  {name:<16} " + ", ".join(changes))
+    return regressions
+
+
+def print_report(results):
+    header = f"{'scenario':<16} {'items':>8} {'seconds':>9} {'items/s':>11} {'min ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak RSS':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results.items():
+        rss = f"{r['peak_rss_kb'] / 1024:.1f} MiB" if r["peak_rss_kb"] is not None else "n/a"
+        print(f"{name:<16} {r['items']:>8} {r['seconds']:>9.3f} {r['throughput']:>11.1f} "
+              f"{r['min_ms']:>9.3f} {r['p50_ms']:>9.3f} {r['p95_ms']:>9.3f} {r['p99_ms']:>9.3f} {rss:>10}")
+        if "responses" in r:
+            print(f"{'':<16} responses: " + ", ".join(f"{k}={v}" for k, v in r["responses"].items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Food Data Scraper benchmarks")
+    parser.add_argument("scenarios", nargs="*", help=f"Scenarios to run (default: all). Choices: {', '.join(SCENARIOS)}")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Relative change counted as a regression")
+    parser.add_argument("--confirm-runs", type=int, default=2,
+                        help="Times a regressed scenario is re-run before the regression is reported")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--api-root", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.api_root)
+        return 0
+
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    results = {}
+    for name in args.scenarios or SCENARIOS:
+        print(f"Running {name}...", flush=True)
+        results[name] = run_scenario(name)
+
+    print()
+    print_report(results)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    for attempt in range(args.confirm_runs):
+        if not regressions:
+            break
+        regressed = sorted({metric.split(".")[0] for metric in regressions})
+        print(f"\nRe-running {', '.join(regressed)} to rule out noise ({attempt + 1}/{args.confirm_runs})...", flush=True)
+        for name in regressed:
+            results[name] = run_scenario(name)
+        regressions = compare({name: results[name] for name in regressed}, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} metric(s) regressed: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -66,13 +66,19 @@ PRELOADED_FOODS = [
     # Additional 49 foods with similar structure will be generated at runtime
 ]
 
+# Product fields requested from the search API
+SEARCH_FIELDS = "code,_id,product_name,brands_tags,categories_tags,packaging_tags,quantity,nutriments,ingredients_text,additives_tags,allergens_tags,labels_tags,countries_tags,manufacturing_places,conservation_conditions,preparation,official_website,contact"
+
 class FoodScraper:
-    def __init__(self, target_count=2000, output_file="food_data.csv", max_api_retries=3):
+    def __init__(self, target_count=2000, output_file="food_data.csv", max_api_retries=3,
+                 api_root="https://world.openfoodfacts.org", request_delay=1.0, retry_delay=2.0):
         self.target_count = target_count
         self.output_file = output_file
         self.max_api_retries = max_api_retries
-        self.base_url = "https://world.openfoodfacts.org/api/v2/product"
-        self.search_url = "https://world.openfoodfacts.org/api/v2/search"
+        self.request_delay = request_delay  # Base pause between pages, in seconds
+        self.retry_delay = retry_delay  # Base backoff between failed attempts, in seconds
+        self.base_url = f"{api_root}/api/v2/product"
+        self.search_url = f"{api_root}/api/v2/search"
         self.user_agent = "FoodNutritionScraper/1.0 (data collection for educational project)"
         self.headers = {"User-Agent": self.user_agent}
         self.fields = [
@@ -89,6 +95,7 @@ class FoodScraper:
             "date_expiration", "code_barres", "site_internet_marque", "service_client_contact"
         ]
         self.products = []
+        self.request_latencies = []  # Seconds per API response, used by the benchmarks
         
     def _extract_nutrient(self, nutriments, nutrient_id, unit=""):
         """Extract nutrient value with its unit if available"""
@@ -172,30 +179,31 @@ class FoodScraper:
         """Search for products with the API with retry logic"""
         for attempt in range(self.max_api_retries):
             try:
-                url = f"https://world.openfoodfacts.org/api/v2/search"
+                url = self.search_url
                 params = {
                     "page": page,
                     "page_size": page_size,
                     "sort_by": "popularity_key",
-                    "fields": "code,_id,product_name,brands_tags,categories_tags,packaging_tags,quantity,nutriments,ingredients_text,additives_tags,allergens_tags,labels_tags,countries_tags,manufacturing_places,conservation_conditions,preparation,official_website,contact"
+                    "fields": SEARCH_FIELDS
                 }
                 
                 print(f"Fetching page {page}... (Attempt {attempt+1}/{self.max_api_retries})")
                 response = requests.get(url, headers=self.headers, params=params, timeout=30)
+                self.request_latencies.append(response.elapsed.total_seconds())
                 
                 if response.status_code == 200:
                     data = response.json()
                     return data.get("products", [])
                 
                 print(f"API request failed with status code: {response.status_code}")
-                time.sleep(2 * (attempt + 1))  # Exponential backoff
+                time.sleep(self.retry_delay * (attempt + 1))  # Exponential backoff
                 
             except requests.exceptions.Timeout:
                 print(f"Request timed out. Retrying... ({attempt+1}/{self.max_api_retries})")
-                time.sleep(2 * (attempt + 1))
+                time.sleep(self.retry_delay * (attempt + 1))
             except Exception as e:
                 print(f"Error searching products on page {page}: {e}")
-                time.sleep(2 * (attempt + 1))
+                time.sleep(self.retry_delay * (attempt + 1))
                 
         print("All API retry attempts failed. Using fallback data.")
         return []
@@ -350,7 +358,7 @@ class FoodScraper:
                     print(f"No products returned from API on page {page}. Retry {retry_count+1}/{max_overall_retries}")
                     retry_count += 1
                     page = 1  # Reset to page 1 for retries
-                    time.sleep(5)  # Wait a bit before retrying
+                    time.sleep(self.retry_delay * 2.5)  # Wait a bit before retrying
                     continue
                 
                 api_success = True
@@ -368,7 +376,7 @@ class FoodScraper:
                 page += 1
                 
                 # Be nice to the API server
-                time.sleep(1 + random.random())
+                time.sleep(self.request_delay * (1 + random.random()))
                 
             # If we couldn't get enough products from the API, use synthetic data
             if len(self.products) < self.target_count: